@@ -0,0 +1,263 @@
+"""
+Shared analysis helpers for the System Analysis Tool.
+Provides the threshold-based checks common to the analyzer modules.
+"""
+
+from bisect import bisect_right
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Tuple
+
+from src.utils.config import Thresholds
+
+# Component statuses, indexed by the number of thresholds a value meets
+STATUS_LEVELS = ('normal', 'warning', 'critical')
+
+# Issue message formatters for usage checks, keyed by status
+USAGE_MESSAGES = {
+    'warning': "{} usage is high: {}%".format,
+    'critical': "{} usage is critically high: {}%".format
+}
+
+# Health score penalties by component status
+HEALTH_PENALTIES = {
+    'critical': 25,
+    'warning': 10
+}
+
+# Per-process percentages above which a process is flagged
+HIGH_CPU_PERCENT = 50
+HIGH_MEMORY_PERCENT = 5
+
+# C-level field extraction for per-process metric dicts
+_USAGE_FIELDS = itemgetter('cpu_percent', 'memory_percent', 'status')
+_ID_FIELDS = itemgetter('pid', 'name')
+
+def _freeze_thresholds(thresholds: Dict[str, Dict[str, float]]) -> Tuple:
+    """Convert a nested thresholds dict into a hashable, order-independent key."""
+    return tuple(sorted(
+        (metric, tuple(sorted(values.items())))
+        for metric, values in thresholds.items()
+        if isinstance(values, dict)
+    ))
+
+@lru_cache(maxsize=8)
+def _merge_thresholds(defaults: Tuple, overrides: Tuple) -> Mapping[str, Thresholds]:
+    """Merge frozen threshold overrides into frozen defaults."""
+    merged = {metric: dict(values) for metric, values in defaults}
+    for metric, values in overrides:
+        if metric in merged:
+            merged[metric].update(values)
+    return MappingProxyType({
+        metric: Thresholds(warning=float(values['warning']), critical=float(values['critical']))
+        for metric, values in merged.items()
+    })
+
+def load_thresholds(config: Any, kind: str,
+                    defaults: Dict[str, Dict[str, float]]) -> Mapping[str, Thresholds]:
+    """
+    Load analysis thresholds, applying overrides from configuration.
+
+    Results are cached on the frozen defaults and overrides, so analyzers
+    built repeatedly from the same configuration share one read-only mapping
+    of immutable Thresholds.
+
+    Args:
+        config: Configuration object
+        kind: Analysis section name under 'analysis' (e.g. 'performance')
+        defaults: Default thresholds keyed by metric
+
+    Returns:
+        Read-only mapping of metric -> Thresholds
+    """
+    analysis = (config.config_data or {}).get('analysis') or {}
+    overrides = (analysis.get(kind) or {}).get('thresholds') or {}
+    return _merge_thresholds(_freeze_thresholds(defaults), _freeze_thresholds(overrides))
+
+def analyze_usage(label: str, metrics: Dict, thresholds: Thresholds,
+                  fields: Iterable[str] = ()) -> Dict:
+    """
+    Analyze a usage percentage against warning/critical thresholds.
+
+    Args:
+        label: Human-readable component name used in issue messages
+        metrics: Collected metrics for the component
+        thresholds: Warning/critical percentages for the component
+        fields: Additional metric fields copied into the results
+
+    Returns:
+        Dict containing usage, extra fields, status and issues
+    """
+    usage = metrics.get('usage', 0.0)
+    results = {'usage': usage}
+    for field in fields:
+        results[field] = metrics.get(field, 0)
+
+    status = STATUS_LEVELS[bisect_right((thresholds.warning, thresholds.critical), usage)]
+    results['status'] = status
+    results['issues'] = [USAGE_MESSAGES[status](label, usage)] if status in USAGE_MESSAGES else []
+
+    return results
+
+def classify_processes(processes: Iterable[Dict], zombies: bool = False) -> Dict[str, List]:
+    """
+    Classify processes by CPU usage, memory usage and zombie state in one pass.
+
+    Args:
+        processes: Iterable of per-process metric dicts
+        zombies: Whether to also collect zombie processes
+
+    Returns:
+        Dict with the process total and the flagged high_cpu, high_memory
+        (and, if requested, zombie) process lists
+    """
+    high_cpu = []
+    high_memory = []
+    zombie = []
+    add_cpu = high_cpu.append
+    add_memory = high_memory.append
+    add_zombie = zombie.append
+    cpu_threshold = HIGH_CPU_PERCENT
+    memory_threshold = HIGH_MEMORY_PERCENT
+    usage_fields = _USAGE_FIELDS
+    id_fields = _ID_FIELDS
+
+    # Counted while iterating so that a lazy process iterator can be passed in
+    total = 0
+    for process in processes:
+        total += 1
+        try:
+            cpu_percent, memory_percent, status = usage_fields(process)
+        except KeyError:
+            cpu_percent = process.get('cpu_percent')
+            memory_percent = process.get('memory_percent')
+            status = process.get('status')
+        cpu_percent = cpu_percent or 0
+        memory_percent = memory_percent or 0
+        is_zombie = zombies and status == 'zombie'
+        if cpu_percent <= cpu_threshold and memory_percent <= memory_threshold and not is_zombie:
+            continue
+
+        try:
+            pid, name = id_fields(process)
+        except KeyError:
+            pid = process.get('pid')
+            name = process.get('name')
+        if cpu_percent > cpu_threshold:
+            add_cpu({'pid': pid, 'name': name, 'cpu_percent': cpu_percent})
+        if memory_percent > memory_threshold:
+            add_memory({'pid': pid, 'name': name, 'memory_percent': memory_percent})
+        if is_zombie:
+            add_zombie({'pid': pid, 'name': name})
+
+    results = {'total': total, 'high_cpu': high_cpu, 'high_memory': high_memory}
+    if zombies:
+        results['zombie'] = zombie
+    return results
+
+def summarize_health(penalty: int, issues: List[str], healthy: str = 'healthy') -> Dict:
+    """
+    Build the overall health summary from accumulated component penalties.
+
+    Args:
+        penalty: Sum of HEALTH_PENALTIES for the flagged components
+        issues: Issues of the flagged components
+        healthy: Status reported when no threshold is reached
+
+    Returns:
+        Dict containing the overall status, score and issues
+    """
+    score = 100 - penalty
+    if score <= 50:
+        status = 'critical'
+    elif score <= 75:
+        status = 'warning'
+    else:
+        status = healthy
+
+    return {
+        'status': status,
+        'score': score,
+        'issues': issues
+    }
+
+class ComponentAnalyzer:
+    """Base class for analyzers built from independent per-component checks."""
+
+    __slots__ = ('_components', '_streamed')
+
+    # Results key of the overall summary, and its status when nothing is flagged
+    summary_key = 'health'
+    healthy_status = 'healthy'
+
+    def __init__(self, components: Dict[str, Tuple[Callable[[Any], Dict], Any]]):
+        """
+        Initialize component analyzer.
+
+        Args:
+            components: Metric name -> (analysis function, default metrics),
+                in result order
+        """
+        self._components = components
+        self._streamed = {}
+
+    def analyze(self, metrics: Dict) -> Dict:
+        """
+        Analyze collected metrics.
+
+        Args:
+            metrics: Dictionary of collected metrics
+
+        Returns:
+            Dict containing analysis results
+        """
+        return self._summarize(
+            (name, analyze_component(metrics.get(name, default)))
+            for name, (analyze_component, default) in self._components.items()
+        )
+
+    def feed(self, name: str, data: Any) -> None:
+        """
+        Analyze a single metrics component as soon as it is collected.
+
+        Components this analyzer does not use are ignored.
+
+        Args:
+            name: Metric component name
+            data: Collected metrics for the component
+        """
+        component = self._components.get(name)
+        if component is not None:
+            self._streamed[name] = component[0](data)
+
+    def finish(self) -> Dict:
+        """
+        Complete a streamed analysis started with feed().
+
+        Components that were never fed are analyzed with their defaults.
+
+        Returns:
+            Dict containing analysis results
+        """
+        streamed, self._streamed = self._streamed, {}
+        return self._summarize(
+            (name, streamed[name] if name in streamed else analyze_component(default))
+            for name, (analyze_component, default) in self._components.items()
+        )
+
+    def _summarize(self, components: Iterable[Tuple[str, Dict]]) -> Dict:
+        """Collect component results and accumulate the overall summary in one pass."""
+        results = {}
+        penalty = 0
+        issues = []
+        penalties = HEALTH_PENALTIES
+        for name, result in components:
+            results[name] = result
+            component_penalty = penalties.get(result['status'])
+            if component_penalty:
+                penalty += component_penalty
+                issues.extend(result['issues'])
+
+        results[self.summary_key] = summarize_health(penalty, issues, self.healthy_status)
+        return results
@@ -4,19 +4,49 @@ Analyzes system security metrics and provides insights.
 """
 
 import logging
-import os
-import platform
-import socket
-import subprocess
-from typing import Dict, List, Optional, Tuple
+import time
+from typing import Dict, List
 
+from src.analysis.common import ComponentAnalyzer
 from src.utils.config import Config
 
 logger = logging.getLogger(__name__)
 
-class SecurityAnalyzer:
+# Commonly vulnerable ports and the services normally bound to them
+VULNERABLE_PORTS = {
+    21: 'FTP',
+    22: 'SSH',
+    23: 'Telnet',
+    25: 'SMTP',
+    3389: 'RDP'
+}
+
+# One bit per port number (65536 bits) for constant-time membership tests
+_VULN_PORT_BITMAP = bytearray(8192)
+for _port in VULNERABLE_PORTS:
+    _VULN_PORT_BITMAP[_port >> 3] |= 1 << (_port & 7)
+del _port
+
+# Known vulnerable services
+VULNERABLE_SERVICES = frozenset([
+    'telnet',
+    'ftp',
+    'rsh',
+    'rlogin',
+    'rexec'
+])
+
+# Certificates expiring within this many seconds are reported as expiring soon
+SSL_EXPIRY_WARNING_SECONDS = 30 * 24 * 60 * 60
+
+class SecurityAnalyzer(ComponentAnalyzer):
     """Analyzes system security metrics."""
     
+    __slots__ = ('config', 'checks')
+    
+    summary_key = 'security_score'
+    healthy_status = 'secure'
+    
     def __init__(self, config: Config):
         """
         Initialize security analyzer.
@@ -26,6 +56,15 @@ class SecurityAnalyzer:
         """
         self.config = config
         self.checks = self._load_security_checks()
+        
+        super().__init__({
+            'ports': (self._analyze_ports, []),
+            'services': (self._analyze_services, []),
+            'updates': (self._analyze_updates, {}),
+            'firewall': (self._analyze_firewall, {}),
+            'antivirus': (self._analyze_antivirus, {}),
+            'ssl': (self._analyze_ssl, [])
+        })
     
     def _load_security_checks(self) -> Dict[str, bool]:
         """Load security check configuration."""
@@ -49,189 +88,137 @@ class SecurityAnalyzer:
         
         return checks
     
-    def analyze(self, metrics: Dict) -> Dict:
-        """
-        Analyze system security metrics.
-        
-        Args:
-            metrics: Dictionary of collected metrics
-            
-        Returns:
-            Dict containing analysis results
-        """
-        results = {
-            'ports': self._analyze_ports(metrics.get('ports', [])),
-            'services': self._analyze_services(metrics.get('services', [])),
-            'updates': self._analyze_updates(metrics.get('updates', {})),
-            'firewall': self._analyze_firewall(metrics.get('firewall', {})),
-            'antivirus': self._analyze_antivirus(metrics.get('antivirus', {})),
-            'ssl': self._analyze_ssl(metrics.get('ssl', []))
-        }
-        
-        # Calculate overall security score
-        results['security_score'] = self._calculate_security_score(results)
-        
-        return results
-    
     def _analyze_ports(self, ports: List[Dict]) -> Dict:
         """Analyze open ports."""
-        results = {
-            'total': len(ports),
-            'open': [],
-            'status': 'normal',
-            'issues': []
-        }
+        open_ports = []
+        add_open = open_ports.append
         
         # Check for commonly vulnerable ports
-        vulnerable_ports = {
-            21: 'FTP',
-            22: 'SSH',
-            23: 'Telnet',
-            25: 'SMTP',
-            3389: 'RDP'
-        }
-        
+        bitmap = _VULN_PORT_BITMAP
         for port in ports:
             port_num = port.get('port')
-            if port_num in vulnerable_ports:
-                results['open'].append({
+            if (isinstance(port_num, int) and 0 <= port_num < 65536
+                    and bitmap[port_num >> 3] & (1 << (port_num & 7))):
+                add_open({
                     'port': port_num,
-                    'service': vulnerable_ports[port_num],
+                    'service': VULNERABLE_PORTS[port_num],
                     'state': port.get('state', 'unknown')
                 })
         
-        if results['open']:
-            results['status'] = 'warning'
-            results['issues'].append(f"Found {len(results['open'])} potentially vulnerable ports open")
+        if open_ports:
+            status, issues = 'warning', [f"Found {len(open_ports)} potentially vulnerable ports open"]
+        else:
+            status, issues = 'normal', []
         
-        return results
+        return {
+            'total': len(ports),
+            'open': open_ports,
+            'status': status,
+            'issues': issues
+        }
     
     def _analyze_services(self, services: List[Dict]) -> Dict:
         """Analyze running services."""
-        results = {
+        # Check for known vulnerable services; the set intersection finds any
+        # hits in one call, so per-service results are only built when needed
+        names = [service.get('name', '').lower() for service in services]
+        hits = VULNERABLE_SERVICES.intersection(names)
+        vulnerable = [
+            {
+                'name': name,
+                'status': service.get('status', 'unknown')
+            }
+            for name, service in zip(names, services)
+            if name in hits
+        ] if hits else []
+        
+        if vulnerable:
+            status, issues = 'warning', [f"Found {len(vulnerable)} potentially vulnerable services running"]
+        else:
+            status, issues = 'normal', []
+        
+        return {
             'total': len(services),
-            'vulnerable': [],
-            'status': 'normal',
-            'issues': []
+            'vulnerable': vulnerable,
+            'status': status,
+            'issues': issues
         }
-        
-        # Check for known vulnerable services
-        vulnerable_services = [
-            'telnet',
-            'ftp',
-            'rsh',
-            'rlogin',
-            'rexec'
-        ]
-        
-        for service in services:
-            name = service.get('name', '').lower()
-            if name in vulnerable_services:
-                results['vulnerable'].append({
-                    'name': name,
-                    'status': service.get('status', 'unknown')
-                })
-        
-        if results['vulnerable']:
-            results['status'] = 'warning'
-            results['issues'].append(f"Found {len(results['vulnerable'])} potentially vulnerable services running")
-        
-        return results
     
     def _analyze_updates(self, updates: Dict) -> Dict:
         """Analyze system updates."""
-        results = {
+        updates_available = updates.get('updates_available', 0)
+        if updates_available > 0:
+            status, issues = 'warning', [f"System has {updates_available} updates available"]
+        else:
+            status, issues = 'normal', []
+        
+        return {
             'last_update': updates.get('last_update', 'unknown'),
-            'updates_available': updates.get('updates_available', 0),
-            'status': 'normal',
-            'issues': []
+            'updates_available': updates_available,
+            'status': status,
+            'issues': issues
         }
-        
-        if results['updates_available'] > 0:
-            results['status'] = 'warning'
-            results['issues'].append(f"System has {results['updates_available']} updates available")
-        
-        return results
     
     def _analyze_firewall(self, firewall: Dict) -> Dict:
         """Analyze firewall status."""
-        results = {
-            'enabled': firewall.get('enabled', False),
+        enabled = firewall.get('enabled', False)
+        if enabled is None:
+            # The collector could not determine the firewall state
+            return {
+                'enabled': None,
+                'rules': firewall.get('rules', []),
+                'status': 'unknown',
+                'issues': ["Firewall status could not be determined"]
+            }
+        return {
+            'enabled': enabled,
             'rules': firewall.get('rules', []),
-            'status': 'normal',
-            'issues': []
+            'status': 'normal' if enabled else 'critical',
+            'issues': [] if enabled else ["Firewall is not enabled"]
         }
-        
-        if not results['enabled']:
-            results['status'] = 'critical'
-            results['issues'].append("Firewall is not enabled")
-        
-        return results
     
     def _analyze_antivirus(self, antivirus: Dict) -> Dict:
         """Analyze antivirus status."""
-        results = {
-            'enabled': antivirus.get('enabled', False),
+        enabled = antivirus.get('enabled', False)
+        return {
+            'enabled': enabled,
             'last_scan': antivirus.get('last_scan', 'unknown'),
-            'status': 'normal',
-            'issues': []
+            'status': 'normal' if enabled else 'critical',
+            'issues': [] if enabled else ["Antivirus is not enabled"]
         }
-        
-        if not results['enabled']:
-            results['status'] = 'critical'
-            results['issues'].append("Antivirus is not enabled")
-        
-        return results
     
     def _analyze_ssl(self, ssl_certs: List[Dict]) -> Dict:
         """Analyze SSL certificates."""
-        results = {
-            'total': len(ssl_certs),
-            'expired': [],
-            'expiring_soon': [],
-            'status': 'normal',
-            'issues': []
-        }
+        expired = []
+        expiring_soon = []
         
+        # Certificates with a 'not_after' epoch timestamp are compared against
+        # cutoffs computed once; others fall back to precomputed flags
+        now = time.time()
+        soon = now + SSL_EXPIRY_WARNING_SECONDS
         for cert in ssl_certs:
-            if cert.get('expired', False):
-                results['expired'].append(cert)
-            elif cert.get('expiring_soon', False):
-                results['expiring_soon'].append(cert)
-        
-        if results['expired']:
-            results['status'] = 'critical'
-            results['issues'].append(f"Found {len(results['expired'])} expired SSL certificates")
-        elif results['expiring_soon']:
-            results['status'] = 'warning'
-            results['issues'].append(f"Found {len(results['expiring_soon'])} SSL certificates expiring soon")
-        
-        return results
-    
-    def _calculate_security_score(self, results: Dict) -> Dict:
-        """Calculate overall security score."""
-        score = {
-            'score': 100,
-            'status': 'secure',
-            'issues': []
-        }
-        
-        # Check each component's status
-        for component, result in results.items():
-            if component == 'security_score':
-                continue
-                
-            if result['status'] == 'critical':
-                score['score'] -= 25
-                score['issues'].extend(result['issues'])
-            elif result['status'] == 'warning':
-                score['score'] -= 10
-                score['issues'].extend(result['issues'])
-        
-        # Update overall status
-        if score['score'] <= 50:
-            score['status'] = 'critical'
-        elif score['score'] <= 75:
-            score['status'] = 'warning'
-        
-        return score 
\ No newline at end of file
+            not_after = cert.get('not_after')
+            if not_after is None:
+                if cert.get('expired', False):
+                    expired.append(cert)
+                elif cert.get('expiring_soon', False):
+                    expiring_soon.append(cert)
+            elif not_after < now:
+                expired.append(cert)
+            elif not_after < soon:
+                expiring_soon.append(cert)
+        
+        if expired:
+            status, issues = 'critical', [f"Found {len(expired)} expired SSL certificates"]
+        elif expiring_soon:
+            status, issues = 'warning', [f"Found {len(expiring_soon)} SSL certificates expiring soon"]
+        else:
+            status, issues = 'normal', []
+        
+        return {
+            'total': len(ssl_certs),
+            'expired': expired,
+            'expiring_soon': expiring_soon,
+            'status': status,
+            'issues': issues
+        } 
\ No newline at end of file
@@ -8,17 +8,26 @@ security, and resource utilization.
 import argparse
 import logging
 import os
+import queue
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from src.analysis.performance import PerformanceAnalyzer
-from src.analysis.security import SecurityAnalyzer
-from src.analysis.resources import ResourceAnalyzer
-from src.monitoring.metrics import MetricsCollector
-from src.reporting.generators import ReportGenerator
+from src.monitoring.metrics_collector import MetricsCollector
 from src.utils.config import Config
 from src.utils.logging import setup_logging
 
+# Marks the end of the collected component stream
+_END_OF_METRICS = object()
+
+def _produce_metrics(metrics_collector, component_queue):
+    """Push collected metric components onto the queue, then the end marker."""
+    try:
+        for component in metrics_collector.iter_components():
+            component_queue.put(component)
+    finally:
+        component_queue.put(_END_OF_METRICS)
+
 def parse_args():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(description="System Analysis Tool")
@@ -45,36 +54,56 @@ def main():
     config = Config(args.config)
     
     try:
-        # Initialize components
+        # Initialize components; analyzers are only imported when enabled
         metrics_collector = MetricsCollector(config)
-        performance_analyzer = PerformanceAnalyzer(config)
-        security_analyzer = SecurityAnalyzer(config)
-        resource_analyzer = ResourceAnalyzer(config)
-        report_generator = ReportGenerator(config)
-
-        # Collect metrics
-        logging.info("Collecting system metrics...")
-        metrics = metrics_collector.collect()
+        analyzers = {}
+        if config.performance_enabled:
+            from src.analysis.performance import PerformanceAnalyzer
+            analyzers['performance'] = PerformanceAnalyzer(config)
+        if config.security_enabled:
+            from src.analysis.security import SecurityAnalyzer
+            analyzers['security'] = SecurityAnalyzer(config)
+        if config.resources_enabled:
+            from src.analysis.resources import ResourceAnalyzer
+            analyzers['resources'] = ResourceAnalyzer(config)
 
-        # Perform analysis
-        logging.info("Performing system analysis...")
-        performance_results = performance_analyzer.analyze(metrics)
-        security_results = security_analyzer.analyze(metrics)
-        resource_results = resource_analyzer.analyze(metrics)
+        # Collect metrics in the background and analyze each component as it arrives,
+        # so analysis overlaps collection; components are kept for the report
+        logging.info("Collecting and analyzing system metrics...")
+        metrics = {}
+        component_queue = queue.Queue(maxsize=4)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            producer = executor.submit(_produce_metrics, metrics_collector, component_queue)
+            components = iter(component_queue.get, _END_OF_METRICS)
+            try:
+                for name, data in components:
+                    metrics[name] = data
+                    for analyzer in analyzers.values():
+                        analyzer.feed(name, data)
+            finally:
+                # Drain the queue so a blocked collector thread can finish
+                for _ in components:
+                    pass
+            producer.result()
+        metrics_collector.close()
+        
+        results = {kind: analyzer.finish() for kind, analyzer in analyzers.items()}
 
         # Generate report
         logging.info("Generating analysis report...")
-        report_path = report_generator.generate(
-            performance_results,
-            security_results,
-            resource_results,
-            output_dir=args.output
-        )
+        from src.reporting.report_generator import ReportGenerator
+        report_generator = ReportGenerator(config)
+        report_generator.output_dir = args.output
+        os.makedirs(args.output, exist_ok=True)
+        try:
+            report_path = report_generator.generate_report(metrics, results)
+        finally:
+            report_generator.close()
 
-        logging.info(f"Analysis complete. Report generated at: {report_path}")
+        logging.info("Analysis complete. Report generated at: %s", report_path)
 
     except Exception as e:
-        logging.error(f"Error during system analysis: {str(e)}")
+        logging.error("Error during system analysis: %s", e)
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -3,18 +3,347 @@ Metrics collection module for the System Analysis Tool.
 Collects various system metrics for analysis.
 """
 
+import heapq
 import logging
 import os
 import platform
 import psutil
+import re
 import socket
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
 from datetime import datetime
-from typing import Dict, List, Optional
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from src.utils.config import Config
 
 logger = logging.getLogger(__name__)
 
+# Procfs socket tables and the hex state codes of locally bound sockets
+PROC_NET_TABLES = {
+    'tcp': ('/proc/net/tcp', '/proc/net/tcp6'),
+    'udp': ('/proc/net/udp', '/proc/net/udp6')
+}
+LISTEN_STATES = {
+    'tcp': ('0A', 'LISTEN'),
+    'udp': ('07', 'NONE')
+}
+
+# Whether the socket tables can be read from procfs; otherwise (non-Linux
+# platforms) sockets are enumerated through psutil.net_connections()
+HAS_PROC_NET = os.path.isdir('/proc/net')
+
+# Files read for the firewall and update status instead of shelling out
+UFW_CONFIG = '/etc/ufw/ufw.conf'
+APT_UPDATE_STAMP = '/var/lib/apt/periodic/update-success-stamp'
+APT_UPDATES_AVAILABLE = '/var/lib/update-notifier/updates-available'
+
+# Seconds a firewall/update status reading stays cached
+SECURITY_STATUS_TTL = 300
+
+# File system scan limits: stop after FILE_SCAN_LIMIT files and report the
+# LARGEST_FILES_LIMIT largest files above LARGE_FILE_MIN_SIZE bytes
+FILE_SCAN_LIMIT = 1000000
+LARGEST_FILES_LIMIT = 100
+LARGE_FILE_MIN_SIZE = 1024 * 1024
+
+# Refresh intervals for slow-changing or expensive components: component ->
+# (monitoring.* config key, default seconds). Unlisted components are
+# collected on every call
+COLLECTION_INTERVALS = {
+    'cpu': ('cpu_interval', 5),
+    'processes': ('process_interval', 60),
+    'file_system': ('file_system_interval', 3600)
+}
+
+# Pseudo, in-memory and remote file systems skipped by the disk collector
+# unless monitoring.include_all_filesystems is set; remote mounts can block
+# disk_usage() for seconds when the server is unreachable
+SKIPPED_FSTYPES = frozenset({
+    'squashfs', 'tmpfs', 'devtmpfs', 'overlay', 'proc', 'sysfs',
+    'cgroup', 'cgroup2', 'autofs', 'nfs', 'nfs4', 'cifs'
+})
+SKIPPED_FSTYPE_PREFIXES = ('fuse.',)
+
+# Seconds the partition list is reused (monitoring.partition_interval)
+PARTITION_INTERVAL = 300
+
+# Seconds to wait for the parallel disk_usage() calls
+DISK_USAGE_TIMEOUT = 2.0
+
+# Per-process fields consumed by the analysis modules
+PROCESS_ATTRS = ('pid', 'name', 'cpu_percent', 'memory_percent', 'status')
+
+def _read_process(proc: psutil.Process) -> Dict:
+    """
+    Read the PROCESS_ATTRS fields of a process inside a single ``oneshot()``.
+    
+    Args:
+        proc: Process handle to read
+        
+    Returns:
+        Dict with the PROCESS_ATTRS keys
+    """
+    with proc.oneshot():
+        return {
+            'pid': proc.pid,
+            'name': proc.name(),
+            'cpu_percent': proc.cpu_percent(),
+            'memory_percent': proc.memory_percent(),
+            'status': proc.status()
+        }
+
+def iter_process_info(handles: Optional[Dict[int, psutil.Process]] = None) -> Iterator[Dict]:
+    """
+    Iterate over running processes, yielding only the fields in PROCESS_ATTRS.
+    
+    Each process is read inside ``oneshot()`` so psutil parses the underlying
+    /proc files once per process instead of once per attribute. PIDs are
+    walked directly rather than through ``process_iter()``, which re-checks
+    every cached process for PID reuse on each call; processes are only
+    read here, never signalled, so that check is not needed.
+    
+    When a handle cache is passed, Process objects are kept in it across
+    calls: only new PIDs get a fresh handle, and handles of exited processes
+    are dropped. Reused handles also make ``cpu_percent()`` report usage
+    since the previous call instead of 0.0. A cached handle that is no
+    longer running, including one whose PID has been recycled by a newer
+    process, is replaced with a fresh one.
+    
+    Args:
+        handles: Optional PID -> Process cache, updated in place
+        
+    Yields:
+        Dict with the PROCESS_ATTRS keys for each accessible process
+    """
+    pids = psutil.pids()
+    if handles is not None:
+        for pid in handles.keys() - set(pids):
+            del handles[pid]
+    
+    for pid in pids:
+        proc = handles.get(pid) if handles is not None else None
+        try:
+            if proc is None or not proc.is_running():
+                proc = psutil.Process(pid)
+                if handles is not None:
+                    handles[pid] = proc
+            info = _read_process(proc)
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            if handles is not None:
+                handles.pop(pid, None)
+            continue
+        yield info
+
+def disk_usage_async(mountpoint: str) -> Future:
+    """
+    Start psutil.disk_usage() for a mountpoint on its own daemon thread.
+    
+    A daemon thread is used instead of an executor so that a call blocked
+    on an unreachable mount neither occupies a shared worker nor delays
+    interpreter exit, which joins executor threads.
+    
+    Args:
+        mountpoint: Mountpoint to measure
+        
+    Returns:
+        Future resolving to the disk_usage() result
+    """
+    future = Future()
+    
+    def run():
+        try:
+            future.set_result(psutil.disk_usage(mountpoint))
+        except Exception as e:
+            future.set_exception(e)
+    
+    threading.Thread(target=run, name=f'disk-usage {mountpoint}', daemon=True).start()
+    return future
+
+def read_proc_file(path: str) -> bytes:
+    """
+    Read a whole procfs file as bytes.
+    
+    Procfs files report a size of zero, so the file is read unbuffered and
+    FileIO.readall() grows its read size as the content comes in, instead
+    of copying through a fixed-size buffer.
+    
+    Args:
+        path: Path of the procfs file
+        
+    Returns:
+        File contents
+    """
+    with open(path, 'rb', buffering=0) as f:
+        return f.read()
+
+def read_proc_lines(path: str) -> List[str]:
+    """
+    Read a procfs file and split it into lines.
+    
+    Args:
+        path: Path of the procfs file
+        
+    Returns:
+        List of lines in the file
+    """
+    return read_proc_file(path).decode().splitlines()
+
+@lru_cache(maxsize=1)
+def _read_firewall_status(ttl_bucket: int) -> Dict:
+    """
+    Read the ufw firewall state; ttl_bucket keys the cache to a time window.
+    
+    Only ufw is understood. Without its configuration file (firewalld,
+    plain nftables/iptables, non-Linux hosts) the state is reported as
+    unknown (enabled None) rather than disabled.
+    """
+    enabled = None
+    try:
+        with open(UFW_CONFIG, 'r') as f:
+            enabled = False
+            for line in f:
+                key, _, value = line.strip().partition('=')
+                if key == 'ENABLED':
+                    enabled = value.strip().strip('"\'').lower() == 'yes'
+    except OSError:
+        pass
+    
+    return {
+        'enabled': enabled,
+        'rules': []
+    }
+
+@lru_cache(maxsize=1)
+def _read_update_status(ttl_bucket: int) -> Dict:
+    """Read apt's update stamp and pending-update count; ttl_bucket keys the cache."""
+    try:
+        last_update = datetime.fromtimestamp(os.stat(APT_UPDATE_STAMP).st_mtime).isoformat()
+    except OSError:
+        last_update = 'unknown'
+    
+    updates_available = 0
+    try:
+        with open(APT_UPDATES_AVAILABLE, 'r') as f:
+            match = re.search(r'(\d+) (?:updates?|packages?) can be (?:applied|installed)', f.read())
+        if match:
+            updates_available = int(match.group(1))
+    except OSError:
+        pass
+    
+    return {
+        'last_update': last_update,
+        'updates_available': updates_available
+    }
+
+def _cpu_total_and_idle(cpu_times) -> Tuple[float, float]:
+    """Return total and idle (including iowait) seconds from a cpu_times() snapshot."""
+    # Guest time is already counted in user/nice on Linux
+    total = sum(cpu_times) - getattr(cpu_times, 'guest', 0) - getattr(cpu_times, 'guest_nice', 0)
+    idle = cpu_times.idle + getattr(cpu_times, 'iowait', 0)
+    return total, idle
+
+class _ScanBudget:
+    """File-count budget shared by concurrent directory scans."""
+    
+    def __init__(self, limit: int):
+        """
+        Initialize scan budget.
+        
+        Args:
+            limit: Number of files after which scanning stops
+        """
+        self.limit = limit
+        self.exhausted = threading.Event()
+        self._count = 0
+        self._lock = threading.Lock()
+    
+    def consume(self, files: int) -> None:
+        """Record scanned files, flagging the budget once the limit is passed."""
+        with self._lock:
+            self._count += files
+            if self._count > self.limit:
+                self.exhausted.set()
+
+def _scan_directory(path: str, largest: List[Tuple[int, str]]) -> Tuple[int, int, List[str]]:
+    """
+    Scan a single directory, recording large files in a bounded min-heap.
+    
+    Entries are counted as os.walk() counts them: symlinks to directories
+    count as directories but are not descended into, and every other entry
+    (including symlinks and special files) counts as a file. Entry types
+    come from the directory listing, so only regular files need a stat()
+    call for their size.
+    
+    Args:
+        path: Directory to scan
+        largest: Min-heap of (size, path) tuples, updated in place
+        
+    Returns:
+        Tuple of the number of files, the number of directories and the
+        list of subdirectory paths to descend into
+    """
+    files = 0
+    dirs = 0
+    subdirs = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                dirs += 1
+                try:
+                    is_symlink = entry.is_symlink()
+                except OSError:
+                    is_symlink = False
+                if not is_symlink:
+                    subdirs.append(entry.path)
+                continue
+            
+            files += 1
+            try:
+                if entry.is_file(follow_symlinks=False):
+                    size = entry.stat(follow_symlinks=False).st_size
+                    if size > LARGE_FILE_MIN_SIZE:
+                        if len(largest) < LARGEST_FILES_LIMIT:
+                            heapq.heappush(largest, (size, entry.path))
+                        elif size > largest[0][0]:
+                            heapq.heapreplace(largest, (size, entry.path))
+            except OSError:
+                continue
+    return files, dirs, subdirs
+
+def _scan_subtree(top: str, budget: _ScanBudget) -> Tuple[int, int, List[Tuple[int, str]]]:
+    """
+    Scan a directory tree until it is exhausted or the shared budget runs out.
+    
+    Args:
+        top: Root of the subtree
+        budget: File-count budget shared with the other scans
+        
+    Returns:
+        Tuple of file count, directory count and the min-heap of largest files
+    """
+    total_files = 0
+    total_dirs = 0
+    largest = []
+    stack = [top]
+    while stack and not budget.exhausted.is_set():
+        try:
+            files, dirs, subdirs = _scan_directory(stack.pop(), largest)
+        except OSError:
+            continue
+        total_files += files
+        total_dirs += dirs
+        stack.extend(subdirs)
+        budget.consume(files)
+    return total_files, total_dirs, largest
+
 class MetricsCollector:
     """Collects system metrics for analysis."""
     
@@ -27,52 +356,149 @@ class MetricsCollector:
         """
         self.config = config
         self.collection_interval = config.get('monitoring.metrics_interval', 60)
+        
+        # Callers within cache_ttl seconds of a sweep share its results
+        self.cache_ttl = config.get('monitoring.cache_ttl', 1.0)
+        self._cache_lock = threading.Lock()
+        self._cached_metrics = None
+        self._cached_at = 0.0
+        
+        # Previous cpu_times() snapshot, for delta-based CPU usage
+        self._prev_cpu_times = None
+        
+        # Values that never change while running, collected once
+        self._static_cache = {}
+        
+        # Process handles reused across process collections, by PID
+        self._proc_cache = {}
+        
+        # Cached partition list, and disk_usage() calls per mountpoint
+        # that have not returned yet
+        self._include_all_filesystems = config.get('monitoring.include_all_filesystems', False)
+        self._partition_interval = config.get('monitoring.partition_interval', PARTITION_INTERVAL)
+        self._partitions = None
+        self._partitions_at = 0.0
+        self._disk_pending = {}
+        
+        # Per-component refresh intervals, with the time and result of each last run
+        self._intervals = {
+            name: config.get(f'monitoring.{key}', default)
+            for name, (key, default) in COLLECTION_INTERVALS.items()
+        }
+        self._last_run = {}
+        self._last_results = {}
+        
+        # Metric components in collection order
+        self._components = (
+            ('system', self._collect_system_info),
+            ('cpu', self._collect_cpu_metrics),
+            ('memory', self._collect_memory_metrics),
+            ('disk', self._collect_disk_metrics),
+            ('network', self._collect_network_metrics),
+            ('ports', self._collect_port_metrics),
+            ('firewall', self._collect_firewall_status),
+            ('updates', self._collect_update_status),
+            ('processes', self._collect_process_metrics),
+            ('file_system', self._collect_file_system_metrics)
+        )
     
     def collect_all(self) -> Dict:
         """
         Collect all system metrics.
         
+        Results are reused for cache_ttl seconds, so concurrent or rapidly
+        repeated callers share a single collection sweep.
+        
         Returns:
             Dict containing all collected metrics
         """
-        try:
-            metrics = {
-                'timestamp': datetime.now().isoformat(),
-                'system': self._collect_system_info(),
-                'cpu': self._collect_cpu_metrics(),
-                'memory': self._collect_memory_metrics(),
-                'disk': self._collect_disk_metrics(),
-                'network': self._collect_network_metrics(),
-                'processes': self._collect_process_metrics(),
-                'file_system': self._collect_file_system_metrics()
-            }
+        with self._cache_lock:
+            if (self._cached_metrics is not None
+                    and time.monotonic() - self._cached_at < self.cache_ttl):
+                return self._cached_metrics
+            
+            try:
+                metrics = dict(self.iter_components())
+            except Exception as e:
+                logger.error("Error collecting metrics: %s", e)
+                raise
+            
+            self._cached_metrics = metrics
+            self._cached_at = time.monotonic()
             return metrics
-        except Exception as e:
-            logger.error(f"Error collecting metrics: {str(e)}")
-            raise
+    
+    def close(self) -> None:
+        """
+        Release state held between collections.
+        
+        Drops cached process handles and partitions, and stops tracking
+        disk_usage() calls still blocked on unreachable mounts; those run on
+        daemon threads and do not delay interpreter exit.
+        """
+        self._proc_cache.clear()
+        self._disk_pending.clear()
+        self._partitions = None
+    
+    def iter_components(self) -> Iterator[Tuple[str, Any]]:
+        """
+        Collect system metrics one component at a time.
+        
+        Lets callers start analyzing a component while the next one is
+        still being collected. Components listed in COLLECTION_INTERVALS
+        are only re-collected once their interval has elapsed.
+        
+        Yields:
+            (component name, collected metrics) tuples, starting with the timestamp
+        """
+        yield 'timestamp', datetime.now().isoformat()
+        for name, collect in self._components:
+            interval = self._intervals.get(name)
+            if interval:
+                # Reuse the previous result until the component's interval elapses
+                now = time.monotonic()
+                last = self._last_run.get(name)
+                if last is None or now - last >= interval:
+                    self._last_results[name] = collect()
+                    self._last_run[name] = now
+                yield name, self._last_results[name]
+            else:
+                yield name, collect()
     
     def _collect_system_info(self) -> Dict:
-        """Collect basic system information."""
-        return {
-            'hostname': socket.gethostname(),
-            'platform': platform.system(),
-            'platform_version': platform.version(),
-            'architecture': platform.machine(),
-            'processor': platform.processor(),
-            'boot_time': datetime.fromtimestamp(psutil.boot_time()).isoformat()
-        }
+        """Collect basic system information, which is static and gathered once."""
+        system_info = self._static_cache.get('system')
+        if system_info is None:
+            system_info = self._static_cache['system'] = {
+                'hostname': socket.gethostname(),
+                'platform': platform.system(),
+                'platform_version': platform.version(),
+                'architecture': platform.machine(),
+                'processor': platform.processor(),
+                'boot_time': datetime.fromtimestamp(psutil.boot_time()).isoformat()
+            }
+        return system_info
     
     def _collect_cpu_metrics(self) -> Dict:
         """Collect CPU metrics."""
         cpu_times = psutil.cpu_times()
+        freq = psutil.cpu_freq()
+        current, fmin, fmax = (freq.current, freq.min, freq.max) if freq else (None, None, None)
+        
+        cpu_counts = self._static_cache.get('cpu_counts')
+        if cpu_counts is None:
+            cpu_counts = self._static_cache['cpu_counts'] = (
+                psutil.cpu_count(),
+                psutil.cpu_count(logical=True)
+            )
+        
         return {
-            'usage_percent': psutil.cpu_percent(interval=1),
-            'count': psutil.cpu_count(),
-            'count_logical': psutil.cpu_count(logical=True),
+            'usage_percent': self._cpu_usage_since_last(cpu_times),
+            'count': cpu_counts[0],
+            'count_logical': cpu_counts[1],
             'frequency': {
-                'current': psutil.cpu_freq().current if psutil.cpu_freq() else None,
-                'min': psutil.cpu_freq().min if psutil.cpu_freq() else None,
-                'max': psutil.cpu_freq().max if psutil.cpu_freq() else None
+                'current': current,
+                'min': fmin,
+                'max': fmax
             },
             'times': {
                 'user': cpu_times.user,
@@ -83,6 +509,31 @@ class MetricsCollector:
             'load_average': psutil.getloadavg()
         }
     
+    def _cpu_usage_since_last(self, cpu_times) -> float:
+        """
+        Compute CPU usage from the change in cpu_times since the previous call.
+        
+        Replaces a blocking cpu_percent(interval=1) sample. On the first call
+        the counters are compared with zero, giving average usage since boot.
+        
+        Args:
+            cpu_times: Current psutil.cpu_times() snapshot
+            
+        Returns:
+            CPU usage percentage
+        """
+        prev, self._prev_cpu_times = self._prev_cpu_times, cpu_times
+        
+        total, idle = _cpu_total_and_idle(cpu_times)
+        if prev is not None:
+            prev_total, prev_idle = _cpu_total_and_idle(prev)
+            total -= prev_total
+            idle -= prev_idle
+        
+        if total <= 0:
+            return 0.0
+        return round(max(0.0, min(100.0, 100.0 * (total - idle) / total)), 1)
+    
     def _collect_memory_metrics(self) -> Dict:
         """Collect memory metrics."""
         memory = psutil.virtual_memory()
@@ -104,12 +555,45 @@ class MetricsCollector:
             }
         }
     
+    def _disk_partitions(self) -> List:
+        """Return mounted partitions worth measuring, refreshed every partition interval."""
+        now = time.monotonic()
+        if self._partitions is None or now - self._partitions_at >= self._partition_interval:
+            partitions = psutil.disk_partitions()
+            if not self._include_all_filesystems:
+                partitions = [
+                    p for p in partitions
+                    if p.fstype not in SKIPPED_FSTYPES
+                    and not p.fstype.startswith(SKIPPED_FSTYPE_PREFIXES)
+                ]
+            self._partitions = partitions
+            self._partitions_at = now
+        return self._partitions
+    
     def _collect_disk_metrics(self) -> Dict:
         """Collect disk metrics."""
+        # Stat partitions in parallel so one hung mount cannot stall the rest.
+        # A mount whose earlier call is still blocked is skipped until that
+        # call returns, so a dead mount holds at most one thread
+        disk_pending = self._disk_pending
+        pending = []
+        for partition in self._disk_partitions():
+            mountpoint = partition.mountpoint
+            future = disk_pending.get(mountpoint)
+            if future is not None and not future.done():
+                logger.debug("Disk usage for %s is still blocked, skipping", mountpoint)
+                continue
+            disk_pending[mountpoint] = disk_usage_async(mountpoint)
+            pending.append((partition, disk_pending[mountpoint]))
+        wait([future for _, future in pending], timeout=DISK_USAGE_TIMEOUT)
+        
         partitions = []
-        for partition in psutil.disk_partitions():
+        for partition, future in pending:
+            if not future.done():
+                logger.warning("Timed out getting disk usage for %s", partition.mountpoint)
+                continue
             try:
-                usage = psutil.disk_usage(partition.mountpoint)
+                usage = future.result()
                 partitions.append({
                     'device': partition.device,
                     'mountpoint': partition.mountpoint,
@@ -121,7 +605,7 @@ class MetricsCollector:
                     'usage': usage.percent
                 })
             except Exception as e:
-                logger.warning(f"Error getting disk usage for {partition.mountpoint}: {str(e)}")
+                logger.warning("Error getting disk usage for %s: %s", partition.mountpoint, e)
         
         io_counters = psutil.disk_io_counters()
         return {
@@ -139,7 +623,6 @@ class MetricsCollector:
     def _collect_network_metrics(self) -> Dict:
         """Collect network metrics."""
         net_io = psutil.net_io_counters()
-        net_connections = psutil.net_connections()
         
         return {
             'io': {
@@ -152,10 +635,72 @@ class MetricsCollector:
                 'dropin': net_io.dropin,
                 'dropout': net_io.dropout
             },
-            'connections': len(net_connections),
+            'connections': self._count_connections(),
             'interfaces': self._get_network_interfaces()
         }
     
+    def _count_connections(self) -> int:
+        """Count inet sockets without building a connection object per socket."""
+        if not HAS_PROC_NET:
+            return len(psutil.net_connections(kind='inet'))
+        
+        count = 0
+        for paths in PROC_NET_TABLES.values():
+            for path in paths:
+                try:
+                    # One row per socket after the header line
+                    count += max(read_proc_file(path).count(b'\n') - 1, 0)
+                except OSError:
+                    continue
+        return count
+    
+    def _collect_port_metrics(self) -> List[Dict]:
+        """Collect locally bound TCP/UDP ports."""
+        ports = {}
+        if not HAS_PROC_NET:
+            for conn in psutil.net_connections(kind='inet'):
+                if conn.status in ('LISTEN', 'NONE') and conn.laddr:
+                    protocol = 'tcp' if conn.type == socket.SOCK_STREAM else 'udp'
+                    ports[(protocol, conn.laddr.port)] = {
+                        'port': conn.laddr.port,
+                        'protocol': protocol,
+                        'state': conn.status
+                    }
+            return list(ports.values())
+        
+        for protocol, paths in PROC_NET_TABLES.items():
+            state_code, state = LISTEN_STATES[protocol]
+            for path in paths:
+                try:
+                    lines = read_proc_lines(path)
+                except OSError:
+                    continue
+                
+                # Skip the header row; columns are sl, local_address, rem_address, st, ...
+                for line in lines[1:]:
+                    fields = line.split()
+                    if len(fields) < 4 or fields[3] != state_code:
+                        continue
+                    port = int(fields[1].rsplit(':', 1)[1], 16)
+                    ports[(protocol, port)] = {
+                        'port': port,
+                        'protocol': protocol,
+                        'state': state
+                    }
+        
+        return list(ports.values())
+    
+    def _collect_firewall_status(self) -> Dict:
+        """Collect firewall status from its configuration file."""
+        # Copy the cached reading so callers cannot mutate it
+        status = _read_firewall_status(int(time.monotonic() // SECURITY_STATUS_TTL))
+        return {**status, 'rules': list(status['rules'])}
+    
+    def _collect_update_status(self) -> Dict:
+        """Collect system update status from package manager state files."""
+        # Copy the cached reading so callers cannot mutate it
+        return dict(_read_update_status(int(time.monotonic() // SECURITY_STATUS_TTL)))
+    
     def _get_network_interfaces(self) -> List[Dict]:
         """Get network interface information."""
         interfaces = []
@@ -179,62 +724,42 @@ class MetricsCollector:
     
     def _collect_process_metrics(self) -> List[Dict]:
         """Collect process metrics."""
-        processes = []
-        for proc in psutil.process_iter(['pid', 'name', 'username', 'status', 'cpu_percent', 'memory_percent']):
-            try:
-                process_info = proc.info
-                processes.append({
-                    'pid': process_info['pid'],
-                    'name': process_info['name'],
-                    'username': process_info['username'],
-                    'status': process_info['status'],
-                    'cpu_percent': process_info['cpu_percent'],
-                    'memory_percent': process_info['memory_percent']
-                })
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                continue
-        
-        return processes
+        return list(iter_process_info(self._proc_cache))
     
     def _collect_file_system_metrics(self) -> Dict:
         """Collect file system metrics."""
         total_files = 0
         total_dirs = 0
-        largest_files = []
+        heaps = []
         
         # Get the root directory to scan
         root_dir = self.config.get('analysis.resources.root_directory', '/')
         
         try:
-            for root, dirs, files in os.walk(root_dir):
-                total_dirs += len(dirs)
-                total_files += len(files)
-                
-                # Get file sizes
-                for file in files:
-                    try:
-                        file_path = os.path.join(root, file)
-                        size = os.path.getsize(file_path)
-                        if size > 1024 * 1024:  # Only track files > 1MB
-                            largest_files.append({
-                                'path': file_path,
-                                'size': size
-                            })
-                    except (OSError, PermissionError):
-                        continue
-                
-                # Limit the number of files we track
-                if total_files > 1000000:  # Stop after 1 million files
-                    break
+            # Scan the root itself, then each top-level subtree on its own thread;
+            # the walk is I/O-bound, so scans overlap while blocked in syscalls
+            budget = _ScanBudget(FILE_SCAN_LIMIT)
+            root_largest = []
+            total_files, total_dirs, seeds = _scan_directory(root_dir, root_largest)
+            heaps.append(root_largest)
+            budget.consume(total_files)
+            
+            max_workers = min(32, 2 * (os.cpu_count() or 1))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(_scan_subtree, seed, budget) for seed in seeds]
+                for future in as_completed(futures):
+                    files, dirs, largest = future.result()
+                    total_files += files
+                    total_dirs += dirs
+                    heaps.append(largest)
         except Exception as e:
-            logger.warning(f"Error scanning file system: {str(e)}")
-        
-        # Sort and limit largest files
-        largest_files.sort(key=lambda x: x['size'], reverse=True)
-        largest_files = largest_files[:100]  # Keep top 100 largest files
+            logger.warning("Error scanning file system: %s", e)
         
         return {
             'total_files': total_files,
             'total_dirs': total_dirs,
-            'largest_files': largest_files
+            'largest_files': [
+                {'path': path, 'size': size}
+                for size, path in heapq.nlargest(LARGEST_FILES_LIMIT, chain.from_iterable(heaps))
+            ]
         } 
\ No newline at end of file
@@ -3,20 +3,247 @@ Report generation module for the System Analysis Tool.
 Formats and outputs analysis results in various formats.
 """
 
+import hashlib
+import heapq
 import json
 import logging
 import os
+import shutil
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-import matplotlib.pyplot as plt
+import matplotlib
+matplotlib.use('Agg')  # Render off-screen; avoids probing for a GUI backend
 import pandas as pd
-from jinja2 import Environment, FileSystemLoader
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 
 from src.utils.config import Config
 
+# Fastest available JSON encoder: orjson, then ujson, then the stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    try:
+        import ujson
+    except ImportError:
+        ujson = None
+
+# Arrow's multithreaded CSV writer for the flat per-process rows, when installed
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
 logger = logging.getLogger(__name__)
 
+# Upper bound on plot worker processes (one per chart)
+PLOT_WORKERS = 5
+
+# Default location of compiled report templates, kept out of the reports tree
+TEMPLATE_CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'system-analysis', 'jinja'
+)
+
+# Entries kept in the rendered report and plot caches
+REPORT_CACHE_SIZE = 32
+
+# Metric components that change on every collection sweep without a change
+# in system state; left out of the report cache keys
+VOLATILE_METRICS = frozenset({'timestamp'})
+
+# Subplot margins every plot starts from; clf() does not reset them
+DEFAULT_MARGINS = {
+    side: matplotlib.rcParams[f'figure.subplot.{side}']
+    for side in ('left', 'right', 'bottom', 'top')
+}
+
+# Per-process figure and Agg canvas, cleared and reused for every plot
+_figure = None
+_canvas = None
+
+def _unlink_output(path: str):
+    """
+    Remove an existing output file before it is rewritten.
+    
+    Cache hits hard-link earlier reports and plots to new paths, so writing
+    into an existing file in place could truncate a shared inode and
+    overwrite the earlier output as well.
+    """
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+def _new_axes(figsize) -> 'matplotlib.axes.Axes':
+    """Clear this process's shared figure and return fresh axes at the given size."""
+    global _figure, _canvas
+    if _figure is None:
+        _figure = Figure(figsize=(12, 6))
+        _canvas = FigureCanvasAgg(_figure)
+    _figure.clf()
+    _figure.set_size_inches(*figsize)
+    return _figure.add_subplot(111)
+
+def _save_figure(path: str, **margins):
+    """Render this process's shared figure to a PNG file, overriding the default margins."""
+    _figure.subplots_adjust(**{**DEFAULT_MARGINS, **margins})
+    _unlink_output(path)
+    _canvas.print_png(path)
+
+def _plot_cpu_usage(cpu_metrics: Dict, output_path: str):
+    """Plot CPU usage metrics."""
+    ax = _new_axes((10, 6))
+    
+    # Plot CPU times
+    times = cpu_metrics['times']
+    ax.bar(list(times.keys()), list(times.values()))
+    ax.set_title('CPU Times Distribution')
+    ax.set_ylabel('Time (seconds)')
+    ax.tick_params(axis='x', labelrotation=45)
+    
+    _save_figure(output_path, bottom=0.2)
+
+def _plot_memory_usage(memory_metrics: Dict, output_path: str):
+    """Plot memory usage metrics."""
+    ax = _new_axes((10, 6))
+    
+    # Plot virtual memory usage
+    virtual = memory_metrics['virtual']
+    ax.pie([virtual['used'], virtual['free']],
+           labels=['Used', 'Free'],
+           autopct='%1.1f%%')
+    ax.set_title('Virtual Memory Usage')
+    
+    _save_figure(output_path)
+
+def _plot_disk_usage(disk_metrics: Dict, output_path: str):
+    """Plot disk usage metrics."""
+    ax = _new_axes((12, 6))
+    
+    # Plot partition usage
+    partitions = disk_metrics['partitions']
+    labels = [p['mountpoint'] for p in partitions]
+    used = [p['used'] for p in partitions]
+    free = [p['free'] for p in partitions]
+    
+    ax.bar(labels, used, label='Used')
+    ax.bar(labels, free, bottom=used, label='Free')
+    ax.set_title('Disk Usage by Partition')
+    ax.set_ylabel('Space (bytes)')
+    ax.tick_params(axis='x', labelrotation=45)
+    ax.legend()
+    
+    _save_figure(output_path, bottom=0.25)
+
+def _plot_process_usage(processes: List[Dict], output_path: str):
+    """Plot process resource usage."""
+    ax = _new_axes((12, 6))
+    
+    # Get top 10 processes by CPU usage
+    top_cpu = heapq.nlargest(10, processes, key=itemgetter('cpu_percent'))
+    
+    ax.barh([p['name'] for p in top_cpu],
+            [p['cpu_percent'] for p in top_cpu])
+    ax.set_title('Top 10 Processes by CPU Usage')
+    ax.set_xlabel('CPU Usage (%)')
+    
+    _save_figure(output_path, left=0.25)
+
+def _plot_health_scores(analysis_results: Dict, output_path: str):
+    """Plot system health scores."""
+    ax = _new_axes((10, 6))
+    
+    # Extract health scores
+    scores = {
+        'Performance': analysis_results.get('performance', {}).get('health', {}).get('score', 0),
+        'Security': analysis_results.get('security', {}).get('health', {}).get('score', 0),
+        'Resources': analysis_results.get('resources', {}).get('health', {}).get('score', 0)
+    }
+    
+    ax.bar(list(scores.keys()), list(scores.values()))
+    ax.set_title('System Health Scores')
+    ax.set_ylabel('Score')
+    ax.set_ylim(0, 100)
+    
+    _save_figure(output_path)
+
+def _dump_json(data: Dict) -> bytes:
+    """Serialize report data to indented UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    if ujson is not None:
+        return ujson.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+def _write_csv(df: pd.DataFrame, path: str):
+    """Write a DataFrame to CSV without its index."""
+    _unlink_output(path)
+    df.to_csv(path, index=False)
+
+def _write_rows_csv(rows: List[Dict], path: str):
+    """
+    Write flat dict rows to CSV, using pyarrow when it is installed.
+    
+    Only flat rows go through Arrow: its CSV writer rejects list columns,
+    which the normalized metrics and analysis frames still contain.
+    """
+    if pa is None:
+        _write_csv(pd.DataFrame(rows), path)
+        return
+    _unlink_output(path)
+    pacsv.write_csv(pa.Table.from_pylist(rows), path)
+
+def _content_key(*parts: Any) -> Optional[str]:
+    """Hash JSON-serializable inputs into a cache key, or None if they cannot be serialized."""
+    try:
+        return hashlib.blake2b(_dump_json(parts), digest_size=16).hexdigest()
+    except (TypeError, ValueError):
+        return None
+
+def _link_or_copy(source: str, destination: str):
+    """Hard-link a previously rendered file to a new path, copying where links are unsupported."""
+    if os.path.abspath(source) == os.path.abspath(destination):
+        return
+    _unlink_output(destination)
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copyfile(source, destination)
+
+def _cache_get(cache: OrderedDict, key: Optional[str]) -> Any:
+    """Look up a cache entry whose files still exist, marking it recently used."""
+    if key is None or key not in cache:
+        return None
+    entry = cache[key]
+    paths = entry[1] if isinstance(entry, tuple) else entry
+    if not all(os.path.exists(path) for path in (paths if isinstance(paths, tuple) else (paths,))):
+        del cache[key]
+        return None
+    cache.move_to_end(key)
+    return entry
+
+def _cache_put(cache: OrderedDict, key: Optional[str], entry: Any):
+    """Store a cache entry, evicting the least recently used beyond REPORT_CACHE_SIZE."""
+    if key is None:
+        return
+    cache[key] = entry
+    cache.move_to_end(key)
+    while len(cache) > REPORT_CACHE_SIZE:
+        cache.popitem(last=False)
+
+def _plot_wrapper(task: Tuple[Callable[[Any, str], None], Any, str]):
+    """Run a (plot function, data, output path) task in a worker process."""
+    plot, data, output_path = task
+    plot(data, output_path)
+
 class ReportGenerator:
     """Generates reports from analysis results."""
     
@@ -35,11 +262,28 @@ class ReportGenerator:
         # Create output directory if it doesn't exist
         os.makedirs(self.output_dir, exist_ok=True)
         
-        # Initialize Jinja2 environment
+        # Initialize Jinja2 environment; compiled templates are cached on disk
+        # so later runs skip parsing, and template files are not re-checked
+        cache_dir = config.get('reporting.template_cache_directory', TEMPLATE_CACHE_DIR)
+        os.makedirs(cache_dir, exist_ok=True)
         self.jinja_env = Environment(
             loader=FileSystemLoader(self.template_dir),
-            autoescape=True
+            autoescape=True,
+            auto_reload=False,
+            enable_async=False,
+            bytecode_cache=FileSystemBytecodeCache(directory=cache_dir)
         )
+        
+        # Load the report template once
+        self._template = self.jinja_env.get_template('report.html')
+        self._template_mtime = os.path.getmtime(self._template.filename)
+        
+        # Plot worker pool, started on first use and kept across reports
+        self._plot_pool = None
+        
+        # Content hash -> previously rendered (timestamp, report path(s)) / plot path
+        self._report_cache = OrderedDict()
+        self._plot_cache = OrderedDict()
     
     def generate_report(self, metrics: Dict, analysis_results: Dict) -> str:
         """
@@ -56,8 +300,23 @@ class ReportGenerator:
             # Generate timestamp for the report
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             
+            # Hash each input once; the report and plot cache keys are built
+            # from these digests, so unchanged inputs reuse earlier output
+            input_keys = {
+                name: _content_key(data) for name, data in metrics.items()
+                if name not in VOLATILE_METRICS
+            }
+            analysis_key = _content_key(analysis_results)
+            key = None
+            if analysis_key is not None and None not in input_keys.values():
+                key = _content_key(self.report_format, self._template_mtime,
+                                   sorted(input_keys.items()), analysis_key)
+            cached = _cache_get(self._report_cache, key)
+            
             # Generate report based on format
-            if self.report_format == 'html':
+            if cached is not None:
+                report_path = self._link_cached_report(cached, timestamp)
+            elif self.report_format == 'html':
                 report_path = self._generate_html_report(metrics, analysis_results, timestamp)
             elif self.report_format == 'json':
                 report_path = self._generate_json_report(metrics, analysis_results, timestamp)
@@ -65,20 +324,32 @@ class ReportGenerator:
                 report_path = self._generate_csv_report(metrics, analysis_results, timestamp)
             else:
                 raise ValueError(f"Unsupported report format: {self.report_format}")
+            _cache_put(self._report_cache, key, (timestamp, report_path))
             
             # Generate visualizations
-            self._generate_visualizations(metrics, analysis_results, timestamp)
+            self._generate_visualizations(metrics, analysis_results, timestamp,
+                                          input_keys, analysis_key)
             
             return report_path
         except Exception as e:
-            logger.error(f"Error generating report: {str(e)}")
+            logger.error("Error generating report: %s", e)
             raise
     
+    def _link_cached_report(self, cached: Tuple[str, Any], timestamp: str) -> Any:
+        """Link a cached report's file(s) under the new timestamp."""
+        cached_timestamp, cached_path = cached
+        paths = []
+        for path in (cached_path if isinstance(cached_path, tuple) else (cached_path,)):
+            new_path = os.path.join(self.output_dir,
+                                    os.path.basename(path).replace(cached_timestamp, timestamp))
+            _link_or_copy(path, new_path)
+            paths.append(new_path)
+        
+        logger.debug("Report inputs unchanged, reused %s", cached_path)
+        return tuple(paths) if isinstance(cached_path, tuple) else paths[0]
+    
     def _generate_html_report(self, metrics: Dict, analysis_results: Dict, timestamp: str) -> str:
         """Generate HTML report."""
-        # Load template
-        template = self.jinja_env.get_template('report.html')
-        
         # Prepare data for template
         template_data = {
             'timestamp': datetime.now().isoformat(),
@@ -89,13 +360,11 @@ class ReportGenerator:
             'metrics': metrics
         }
         
-        # Render template
-        html_content = template.render(**template_data)
-        
-        # Save report
+        # Render template straight to the report file
         report_path = os.path.join(self.output_dir, f'report_{timestamp}.html')
+        _unlink_output(report_path)
         with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+            self._template.stream(**template_data).dump(f)
         
         return report_path
     
@@ -108,132 +377,74 @@ class ReportGenerator:
         }
         
         report_path = os.path.join(self.output_dir, f'report_{timestamp}.json')
-        with open(report_path, 'w', encoding='utf-8') as f:
-            json.dump(report_data, f, indent=2)
+        _unlink_output(report_path)
+        with open(report_path, 'wb') as f:
+            f.write(_dump_json(report_data))
         
         return report_path
     
-    def _generate_csv_report(self, metrics: Dict, analysis_results: Dict, timestamp: str) -> str:
+    def _generate_csv_report(self, metrics: Dict, analysis_results: Dict, timestamp: str) -> Tuple[str, str, str]:
         """Generate CSV report."""
-        # Convert metrics to DataFrame
-        metrics_df = pd.DataFrame([metrics])
+        # Flatten nested metrics into dotted columns; per-process rows get their own file
+        metrics_df = pd.json_normalize(
+            {key: value for key, value in metrics.items() if key != 'processes'},
+            sep='.', max_level=3
+        )
+        processes = metrics.get('processes') or []
         
-        # Convert analysis results to DataFrame
-        analysis_df = pd.DataFrame([analysis_results])
+        # Flatten analysis results the same way
+        analysis_df = pd.json_normalize(analysis_results, sep='.', max_level=3)
         
         # Save reports
         metrics_path = os.path.join(self.output_dir, f'metrics_{timestamp}.csv')
         analysis_path = os.path.join(self.output_dir, f'analysis_{timestamp}.csv')
+        processes_path = os.path.join(self.output_dir, f'processes_{timestamp}.csv')
         
-        metrics_df.to_csv(metrics_path, index=False)
-        analysis_df.to_csv(analysis_path, index=False)
+        _write_csv(metrics_df, metrics_path)
+        _write_csv(analysis_df, analysis_path)
+        _write_rows_csv(processes, processes_path)
         
-        return metrics_path, analysis_path
+        return metrics_path, analysis_path, processes_path
     
-    def _generate_visualizations(self, metrics: Dict, analysis_results: Dict, timestamp: str):
-        """Generate visualization plots."""
+    def _generate_visualizations(self, metrics: Dict, analysis_results: Dict, timestamp: str,
+                                 input_keys: Dict[str, Optional[str]], analysis_key: Optional[str]):
+        """Generate visualization plots, reusing those whose input digest is cached."""
         # Create visualizations directory
         viz_dir = os.path.join(self.output_dir, 'visualizations', timestamp)
         os.makedirs(viz_dir, exist_ok=True)
         
-        # CPU Usage Plot
-        self._plot_cpu_usage(metrics['cpu'], viz_dir)
-        
-        # Memory Usage Plot
-        self._plot_memory_usage(metrics['memory'], viz_dir)
-        
-        # Disk Usage Plot
-        self._plot_disk_usage(metrics['disk'], viz_dir)
-        
-        # Process Resource Usage Plot
-        self._plot_process_usage(metrics['processes'], viz_dir)
-        
-        # Health Score Plot
-        self._plot_health_scores(analysis_results, viz_dir)
-    
-    def _plot_cpu_usage(self, cpu_metrics: Dict, output_dir: str):
-        """Plot CPU usage metrics."""
-        plt.figure(figsize=(10, 6))
-        
-        # Plot CPU times
-        times = cpu_metrics['times']
-        plt.bar(times.keys(), times.values())
-        plt.title('CPU Times Distribution')
-        plt.ylabel('Time (seconds)')
-        plt.xticks(rotation=45)
-        
-        plt.tight_layout()
-        plt.savefig(os.path.join(output_dir, 'cpu_usage.png'))
-        plt.close()
-    
-    def _plot_memory_usage(self, memory_metrics: Dict, output_dir: str):
-        """Plot memory usage metrics."""
-        plt.figure(figsize=(10, 6))
-        
-        # Plot virtual memory usage
-        virtual = memory_metrics['virtual']
-        plt.pie([virtual['used'], virtual['free']],
-                labels=['Used', 'Free'],
-                autopct='%1.1f%%')
-        plt.title('Virtual Memory Usage')
-        
-        plt.tight_layout()
-        plt.savefig(os.path.join(output_dir, 'memory_usage.png'))
-        plt.close()
-    
-    def _plot_disk_usage(self, disk_metrics: Dict, output_dir: str):
-        """Plot disk usage metrics."""
-        plt.figure(figsize=(12, 6))
-        
-        # Plot partition usage
-        partitions = disk_metrics['partitions']
-        labels = [p['mountpoint'] for p in partitions]
-        used = [p['used'] for p in partitions]
-        free = [p['free'] for p in partitions]
-        
-        plt.bar(labels, used, label='Used')
-        plt.bar(labels, free, bottom=used, label='Free')
-        plt.title('Disk Usage by Partition')
-        plt.ylabel('Space (bytes)')
-        plt.xticks(rotation=45)
-        plt.legend()
-        
-        plt.tight_layout()
-        plt.savefig(os.path.join(output_dir, 'disk_usage.png'))
-        plt.close()
-    
-    def _plot_process_usage(self, processes: List[Dict], output_dir: str):
-        """Plot process resource usage."""
-        plt.figure(figsize=(12, 6))
-        
-        # Get top 10 processes by CPU usage
-        top_cpu = sorted(processes, key=lambda x: x['cpu_percent'], reverse=True)[:10]
-        
-        plt.barh([p['name'] for p in top_cpu],
-                 [p['cpu_percent'] for p in top_cpu])
-        plt.title('Top 10 Processes by CPU Usage')
-        plt.xlabel('CPU Usage (%)')
-        
-        plt.tight_layout()
-        plt.savefig(os.path.join(output_dir, 'process_usage.png'))
-        plt.close()
-    
-    def _plot_health_scores(self, analysis_results: Dict, output_dir: str):
-        """Plot system health scores."""
-        plt.figure(figsize=(10, 6))
-        
-        # Extract health scores
-        scores = {
-            'Performance': analysis_results.get('performance', {}).get('health', {}).get('score', 0),
-            'Security': analysis_results.get('security', {}).get('health', {}).get('score', 0),
-            'Resources': analysis_results.get('resources', {}).get('health', {}).get('score', 0)
-        }
-        
-        plt.bar(scores.keys(), scores.values())
-        plt.title('System Health Scores')
-        plt.ylabel('Score')
-        plt.ylim(0, 100)
-        
-        plt.tight_layout()
-        plt.savefig(os.path.join(output_dir, 'health_scores.png'))
-        plt.close() 
\ No newline at end of file
+        tasks = [
+            (_plot_cpu_usage, metrics['cpu'], os.path.join(viz_dir, 'cpu_usage.png')),
+            (_plot_memory_usage, metrics['memory'], os.path.join(viz_dir, 'memory_usage.png')),
+            (_plot_disk_usage, metrics['disk'], os.path.join(viz_dir, 'disk_usage.png')),
+            (_plot_process_usage, metrics['processes'], os.path.join(viz_dir, 'process_usage.png')),
+            (_plot_health_scores, analysis_results, os.path.join(viz_dir, 'health_scores.png'))
+        ]
+        data_keys = [input_keys.get('cpu'), input_keys.get('memory'), input_keys.get('disk'),
+                     input_keys.get('processes'), analysis_key]
+        
+        # Link plots whose input data is unchanged; render only the rest
+        pending = []
+        for task, data_key in zip(tasks, data_keys):
+            plot, _, output_path = task
+            key = f'{plot.__name__}:{data_key}' if data_key is not None else None
+            cached_path = _cache_get(self._plot_cache, key)
+            if cached_path is not None:
+                _link_or_copy(cached_path, output_path)
+            else:
+                pending.append((task, key))
+        if not pending:
+            return
+        
+        # Rasterization and PNG compression hold the GIL, so plot in processes
+        if self._plot_pool is None:
+            self._plot_pool = ProcessPoolExecutor(max_workers=min(PLOT_WORKERS, os.cpu_count() or 1))
+        list(self._plot_pool.map(_plot_wrapper, [task for task, _ in pending]))
+        for (_, _, output_path), key in pending:
+            _cache_put(self._plot_cache, key, output_path)
+    
+    def close(self):
+        """Shut down the plot worker pool."""
+        if self._plot_pool is not None:
+            self._plot_pool.shutdown()
+            self._plot_pool = None 
\ No newline at end of file
@@ -4,12 +4,46 @@ Handles loading and managing configuration settings from YAML files.
 """
 
 import os
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 import yaml
 from pydantic import BaseSettings, Field
 
+# Use the LibYAML-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+def _flatten(data: Dict[str, Any], prefix: str, flat: Dict[str, Any]) -> Dict[str, Any]:
+    """Record every nested value of data under its dotted key path."""
+    for key, value in data.items():
+        path = f"{prefix}{key}"
+        flat[path] = value
+        if isinstance(value, dict):
+            _flatten(value, f"{path}.", flat)
+    return flat
+
+@dataclass(frozen=True)
+class Thresholds:
+    """Resolved warning/critical thresholds for a single metric."""
+    
+    __slots__ = ('warning', 'critical')
+    
+    warning: float
+    critical: float
+    
+    def __getstate__(self):
+        """Return slot values for pickling and copying."""
+        return (self.warning, self.critical)
+    
+    def __setstate__(self, state):
+        """Restore slot values, bypassing the frozen __setattr__."""
+        object.__setattr__(self, 'warning', state[0])
+        object.__setattr__(self, 'critical', state[1])
+
 class Config(BaseSettings):
     """Configuration manager for the System Analysis Tool."""
     
@@ -46,13 +80,16 @@ class Config(BaseSettings):
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from YAML file."""
         try:
-            with open(self.config_path, 'r') as f:
-                return yaml.safe_load(f)
+            with open(self.config_path, 'rb') as f:
+                return yaml.load(f, Loader=_YamlLoader)
         except Exception as e:
             raise ValueError(f"Error loading configuration file: {str(e)}")
     
     def _update_settings(self):
         """Update settings from loaded configuration."""
+        # Dotted-key lookup table, rebuilt on the next get()
+        self._flat = None
+        
         if not self.config_data:
             return
             
@@ -96,8 +133,19 @@ class Config(BaseSettings):
             self.api_port = api.get('port', 8000)
     
     def get(self, key: str, default: Any = None) -> Any:
-        """Get configuration value by key."""
-        return self.config_data.get(key, default)
+        """
+        Get configuration value by key.
+        
+        Args:
+            key: Top-level key or dotted path (e.g. 'monitoring.cache_ttl')
+            default: Value returned if the key is not configured
+            
+        Returns:
+            Configured value or default
+        """
+        if self._flat is None:
+            self._flat = _flatten(self.config_data or {}, '', {})
+        return self._flat.get(key, default)
     
     def save(self, path: Optional[str] = None) -> None:
         """Save current configuration to file."""
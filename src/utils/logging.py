@@ -3,11 +3,20 @@ Logging utility for the System Analysis Tool.
 Provides centralized logging configuration and management.
 """
 
+import atexit
+import copy
 import logging
 import logging.handlers
 import os
+from collections import deque
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
+
+# Format fields that need the thread/process details gathered for each record
+THREAD_PROCESS_FIELDS = ('%(thread', '%(process', '%(processName')
+
+# Records buffered before the log file is written, unless one is ERROR or above
+LOG_BUFFER_CAPACITY = 1000
 
 def setup_logging(
     level: int = logging.INFO,
@@ -31,19 +40,29 @@ def setup_logging(
         format_str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     formatter = logging.Formatter(format_str)
     
+    # Only gather thread/process details per record when the format uses them
+    collect_details = any(field in format_str for field in THREAD_PROCESS_FIELDS)
+    logging.logThreads = collect_details
+    logging.logProcesses = collect_details
+    logging.logMultiprocessing = collect_details
+    
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
     
-    # Remove existing handlers
+    # Remove existing handlers, flushing any buffered records
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+        handler.close()
     
     # Add console handler
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
     root_logger.addHandler(console_handler)
     
+    # Route warnings.warn() output through the same handlers
+    logging.captureWarnings(True)
+    
     # Add file handler if log file specified
     if log_file:
         # Create log directory if it doesn't exist
@@ -58,7 +77,16 @@ def setup_logging(
             backupCount=backup_count
         )
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        
+        # Batch file writes; errors and shutdown flush the buffer immediately
+        buffered_handler = logging.handlers.MemoryHandler(
+            capacity=LOG_BUFFER_CAPACITY,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True
+        )
+        atexit.register(buffered_handler.flush)
+        root_logger.addHandler(buffered_handler)
 
 def get_logger(name: str) -> logging.Logger:
     """
@@ -75,22 +103,26 @@ def get_logger(name: str) -> logging.Logger:
 class LogCapture:
     """Context manager for capturing log output."""
     
-    def __init__(self, logger_name: str, level: int = logging.INFO):
+    def __init__(self, logger_name: str, level: int = logging.INFO,
+                 maxlen: Optional[int] = 10000, keep_exc_info: bool = False):
         """
         Initialize log capture.
         
         Args:
             logger_name: Name of the logger to capture
             level: Logging level to capture
+            maxlen: Maximum number of records kept, oldest dropped first (default: 10000, None for unbounded)
+            keep_exc_info: Whether captured records keep their exception tracebacks (default: False)
         """
         self.logger = logging.getLogger(logger_name)
         self.level = level
+        self.keep_exc_info = keep_exc_info
         self.handler = None
-        self.records = []
+        self.records = deque(maxlen=maxlen)
     
     def __enter__(self):
         """Set up log capture."""
-        self.handler = LogCaptureHandler(self.records)
+        self.handler = LogCaptureHandler(self.records, keep_exc_info=self.keep_exc_info)
         self.handler.setLevel(self.level)
         self.logger.addHandler(self.handler)
         return self
@@ -100,23 +132,32 @@ class LogCapture:
         if self.handler:
             self.logger.removeHandler(self.handler)
     
-    def get_records(self):
+    def get_records(self) -> List[logging.LogRecord]:
         """Get captured log records."""
-        return self.records
+        return list(self.records)
 
 class LogCaptureHandler(logging.Handler):
     """Custom handler for capturing log records."""
     
-    def __init__(self, records):
+    def __init__(self, records=None, maxlen: Optional[int] = 10000, keep_exc_info: bool = False):
         """
         Initialize log capture handler.
         
         Args:
-            records: List to store captured log records
+            records: List or deque to store captured log records (default: None, creates a bounded deque)
+            maxlen: Maximum number of records kept when records is not given (default: 10000)
+            keep_exc_info: Whether captured records keep their exception tracebacks (default: False)
         """
         super().__init__()
-        self.records = records
+        self.records = records if records is not None else deque(maxlen=maxlen)
+        self.keep_exc_info = keep_exc_info
     
     def emit(self, record):
         """Store log record."""
+        # Keep a traceback-free copy so captured records do not pin frames in
+        # memory; the original still reaches the remaining handlers intact
+        if record.exc_info and not self.keep_exc_info:
+            record = copy.copy(record)
+            record.exc_info = None
+            record.exc_text = None
         self.records.append(record) 
\ No newline at end of file